@@ -1,6 +1,6 @@
 import brian.motors as motors
-from brian.audio import play_tone
 import time
+import array
 import math
 
 #########################
@@ -9,11 +9,66 @@ import math
 LARGE_MOTOR_MAX_SPEED = 1050  # stupňů za sekundu
 MEDIUM_MOTOR_MAX_SPEED = 1560  # stupňů za sekundu
 
+# Druhy úseků trasy pro `Pilot.execute_path()`
+PATH_TRAVEL = 0
+PATH_ROTATE = 1
+PATH_STEER = 2
+
+# Brian (MicroPython) má přetékající čítač ticks_ms; na PC se použije time.monotonic
+try:
+    _ticks_ms = time.ticks_ms
+    _ticks_add = time.ticks_add
+    _ticks_diff = time.ticks_diff
+except AttributeError:
+    def _ticks_ms():
+        return int(time.monotonic() * 1000)
+
+    def _ticks_add(ticks, delta):
+        return ticks + delta
+
+    def _ticks_diff(end, start):
+        return end - start
+
+_PI = math.pi
+_RAD = math.radians
+
+
+def _steer_plan(
+    left_speed: float, right_speed: float, mm_per_deg: float, axle_inv: float, angle: float
+):
+    """
+    Spočítá, o kolik stupňů a jakou rychlostí se mají otočit kola,
+    aby se robot při jízdě po kružnici natočil o *angle* stupňů.
+
+    Návratová hodnota:
+        tuple: (úhel levého kola, rychlost levého, úhel pravého kola, rychlost pravého)
+    """
+    # Rychlosti jsou v deg/s motoru, takže ujetý úhel kola je rovnou
+    # rychlost * čas – převod přes milimetry se vykrátí.
+    omega = (right_speed - left_speed) * mm_per_deg * axle_inv
+
+    t = _RAD(angle) / abs(omega)
+
+    return (
+        round(left_speed * t),
+        round(abs(left_speed)),
+        round(right_speed * t),
+        round(abs(right_speed)),
+    )
+
 
 ######################################
 ### Třída pro řízení pohybu robota ###
 ######################################
 class Pilot:
+    __slots__ = (
+        "left_motor", "right_motor", "_wheel_diameter", "_axle_width",
+        "_reverse", "_dir", "_speed", "_signed_speed", "_angle_offset",
+        "_deg_per_mm", "_mm_per_deg", "_axle_inv", "_rotate_factor", "_get_angle_scale",
+        "_l_rot", "_r_rot", "_l_run", "_r_run", "_l_wait", "_r_wait",
+        "_l_brake", "_r_brake", "_l_angle", "_r_angle", "_l_speed", "_r_speed",
+    )
+
     def __init__(
         self,
         left_motor: motors.Motor,
@@ -33,17 +88,81 @@ class Pilot:
         """
         self.left_motor = left_motor
         self.right_motor = right_motor
-        self.wheel_diameter = wheel_diameter
-        self.axle_width = axle_width
-        self.reverse = bool(reverse)
+        self._wheel_diameter = wheel_diameter
+        self._axle_width = axle_width
+        self._speed = 400  # deg/s
+        self.reverse = reverse
+        self._recompute_cached()
 
-        self.speed = 400  # deg/s
         self.left_motor.wait_until_ready()
         self.right_motor.wait_until_ready()
 
-        self._angle_offset = (
-            self.left_motor.current_angle() - self.right_motor.current_angle()
-        )
+        self._l_rot = self.left_motor.rotate_by_angle
+        self._r_rot = self.right_motor.rotate_by_angle
+        self._l_run = self.left_motor.run_at_speed
+        self._r_run = self.right_motor.run_at_speed
+        self._l_wait = self.left_motor.wait_for_movement
+        self._r_wait = self.right_motor.wait_for_movement
+        self._l_brake = self.left_motor.brake
+        self._r_brake = self.right_motor.brake
+        self._l_angle = self.left_motor.current_angle
+        self._r_angle = self.right_motor.current_angle
+        self._l_speed = self.left_motor.current_speed
+        self._r_speed = self.right_motor.current_speed
+
+        self._angle_offset = self._l_angle() - self._r_angle()
+
+    @property
+    def reverse(self) -> bool:
+        """True, pokud má robot jezdit obráceně (prohozený význam vpřed/vzad)."""
+        return self._reverse
+
+    @reverse.setter
+    def reverse(self, reverse: bool):
+        self._reverse = bool(reverse)
+        self._dir = -1 if self._reverse else 1
+        self._signed_speed = self._dir * self._speed
+
+    @property
+    def speed(self) -> float:
+        """Základní rychlost otáčení motorů (deg/s)."""
+        return self._speed
+
+    @speed.setter
+    def speed(self, speed: float):
+        self._speed = speed
+        self._signed_speed = self._dir * speed
+
+    @property
+    def wheel_diameter(self) -> float:
+        """Průměr kola v milimetrech."""
+        return self._wheel_diameter
+
+    @wheel_diameter.setter
+    def wheel_diameter(self, wheel_diameter: float):
+        self._wheel_diameter = wheel_diameter
+        self._recompute_cached()
+
+    @property
+    def axle_width(self) -> float:
+        """Vzdálenost mezi koly v milimetrech."""
+        return self._axle_width
+
+    @axle_width.setter
+    def axle_width(self, axle_width: float):
+        self._axle_width = axle_width
+        self._recompute_cached()
+
+    def _recompute_cached(self):
+        """Přepočítá převodní konstanty odvozené z *wheel_diameter* a *axle_width*."""
+        self._deg_per_mm = 360.0 / (_PI * self._wheel_diameter)
+        self._mm_per_deg = (_PI * self._wheel_diameter) / 360.0
+        self._axle_inv = 1.0 / self._axle_width
+        # úhel kola na stupeň otočení robota = (pi * axle_width / 360) * _deg_per_mm
+        self._rotate_factor = self._axle_width / self._wheel_diameter
+        # rozdíl úhlů kol * (wheel_diameter / 2) = rozdíl oblouků,
+        # oblouk / axle_width = natočení v radiánech → převod na stupně
+        self._get_angle_scale = self._wheel_diameter / (2 * self._axle_width)
 
     def _mm_to_deg(self, mm: float) -> float:
         """
@@ -55,7 +174,7 @@ class Pilot:
         Návratová hodnota:
             float: Vzdálenost převedená na úhel v stupních.
         """
-        return round(mm * 360 / (math.pi * self.wheel_diameter))
+        return round(mm * self._deg_per_mm)
 
     def deg_to_mm(self, deg: float) -> float:
         """
@@ -67,25 +186,53 @@ class Pilot:
         Návratová hodnota:
             float: Úhel převedený na vzdálenost v milimetrech.
         """
-        return deg * (math.pi * self.wheel_diameter) / 360
+        return deg * self._mm_per_deg
 
     def _run_motor_at_speeds(self, left_speed: float, right_speed: float):
         """Nastaví okamžité rychlosti motorů (deg/s, vč. znaménka)."""
-        self.left_motor.run_at_speed(round(left_speed))
-        self.right_motor.run_at_speed(round(right_speed))
+        self._l_run(round(left_speed))
+        self._r_run(round(right_speed))
+
+    def _plan_travel(self, distance: float):
+        """Vrátí (úhel L, rychlost L, úhel P, rychlost P) pro jízdu o *distance* mm."""
+        degrees = self._dir * self._mm_to_deg(distance)
+        speed = round(self._speed)
+        return degrees, speed, degrees, speed
+
+    def _plan_rotate(self, angle: float):
+        """Vrátí (úhel L, rychlost L, úhel P, rychlost P) pro otočení o *angle* stupňů."""
+        degrees = round(angle * self._rotate_factor)
+        speed = round(self._signed_speed)
+        return degrees, speed, -degrees, -speed
+
+    def _steer_speeds(self, turn_rate: float):
+        """Vrátí rychlosti (levá, pravá) v deg/s pro *turn_rate* (ořízne na −200 … 200)."""
+        tr = -200 if turn_rate < -200 else (200 if turn_rate > 200 else turn_rate)
+        abs_tr = tr if tr > 0 else -tr
+        ratio = 1 - abs_tr * 0.01 if abs_tr <= 100 else (100 - abs_tr) * 0.01
+
+        speed = self._signed_speed
+        if tr > 0:
+            return speed * ratio, speed
+        return speed, speed * ratio
+
+    def _plan_steer(self, turn_rate: float, angle: float):
+        """Vrátí (úhel L, rychlost L, úhel P, rychlost P) pro oblouk s natočením o *angle* stupňů."""
+        if turn_rate == 0:
+            raise ValueError("U jizdy rovne neni uhel steer(0)")
+        left_speed, right_speed = self._steer_speeds(turn_rate)
+        return _steer_plan(left_speed, right_speed, self._mm_per_deg, self._axle_inv, angle)
 
     ################
     ### MOVEMENT ###
     ################
     def forward(self):
         """Jede vpřed rychlostí *speed* (deg/s) dokud se nezavolá `stop()`."""
-        direction = -1 if self.reverse else 1
-        self._run_motor_at_speeds(direction * self.speed, direction * self.speed)
+        self._run_motor_at_speeds(self._signed_speed, self._signed_speed)
 
     def backward(self):
         """Jede vzad rychlostí *speed* (deg/s) dokud se nezavolá `stop()`."""
-        direction = 1 if self.reverse else -1
-        self._run_motor_at_speeds(direction * self.speed, direction * self.speed)
+        self._run_motor_at_speeds(-self._signed_speed, -self._signed_speed)
 
     def travel(self, distance: float, wait_until_done: bool = True, timeout: float = None):
         """
@@ -95,20 +242,15 @@ class Pilot:
             distance (float): Vzdálenost v milimetrech, kterou má robot ujet.
             wait_until_done (bool, volitelné): Pokud je True, počká, dokud robot nedojede. Výchozí hodnota je True.
         """
-        degrees = self._mm_to_deg(distance)
-
-        if self.reverse:
-            degrees = -degrees
-        self.left_motor.rotate_by_angle(round(degrees), round(self.speed), 0)
-        self.right_motor.rotate_by_angle(round(degrees), round(self.speed), 0)
+        degrees = self._dir * self._mm_to_deg(distance)
+        speed = round(self._speed)
+        self._l_rot(degrees, speed, 0)
+        self._r_rot(degrees, speed, 0)
 
         if wait_until_done:
-            if timeout is None:
-                self.left_motor.wait_for_movement()
-                self.right_motor.wait_for_movement()
-            else:
-                self.left_motor.wait_for_movement(timeout*1000)
-                self.right_motor.wait_for_movement(timeout*1000)
+            timeout_ms = None if timeout is None else timeout * 1000
+            self._l_wait(timeout_ms)
+            self._r_wait(timeout_ms)
 
     def rotate(self, angle: float, wait_until_done: bool = True, timeout: float = None):
         """
@@ -118,22 +260,15 @@ class Pilot:
             angle (float): Úhel otočení v stupních.
             wait_until_done (bool, volitelné): Pokud je True, počká, dokud robot nedokončí otáčení. Výchozí hodnota je True.
         """
-        arc_mm = (angle / 360) * math.pi * self.axle_width
-        degrees = self._mm_to_deg(arc_mm)
-
-        left_speed = self.speed if not self.reverse else -self.speed
-        right_speed = -left_speed
-
-        self.left_motor.rotate_by_angle(round(degrees), round(left_speed), 0)
-        self.right_motor.rotate_by_angle(-round(degrees), round(right_speed), 0)
+        degrees = round(angle * self._rotate_factor)
+        speed = round(self._signed_speed)
+        self._l_rot(degrees, speed, 0)
+        self._r_rot(-degrees, -speed, 0)
 
         if wait_until_done:
-            if timeout is None:
-                self.left_motor.wait_for_movement()
-                self.right_motor.wait_for_movement()
-            else:
-                self.left_motor.wait_for_movement(timeout*1000)
-                self.right_motor.wait_for_movement(timeout*1000)
+            timeout_ms = None if timeout is None else timeout * 1000
+            self._l_wait(timeout_ms)
+            self._r_wait(timeout_ms)
 
     def steer(
         self, turn_rate: float, angle: float = None, wait_until_done: bool = True, timeout: float = None
@@ -153,66 +288,64 @@ class Pilot:
           `False`  → func vrátí hned, motory jedou dál
           `True` → po dokončení (nebo při nekonečné jízdě nevrací)
         """
-        turn_rate = max(-200, min(200, turn_rate))
-
-        if turn_rate == 0:
-            if angle is not None:
-                raise ValueError("U jizdy rovne neni uhel steer(0)")
-            self.forward()
-            return
-
-        abs_tr = abs(turn_rate)
-        if abs_tr <= 100:
-            ratio = 1 - abs_tr / 100
-        else:
-            ratio = -(abs_tr - 100) / 100
-
-        if turn_rate > 0:
-            left_speed = self.speed * ratio
-            right_speed = self.speed
-        else:
-            left_speed = self.speed
-            right_speed = self.speed * ratio
-
-        if self.reverse:
-            left_speed = -left_speed
-            right_speed = -right_speed
-
         if angle is None:
-            self._run_motor_at_speeds(left_speed, right_speed)
+            self._run_motor_at_speeds(*self._steer_speeds(turn_rate))
             return
 
-        mm_per_deg = (math.pi * self.wheel_diameter) / 360
-        v_l_mm = left_speed * mm_per_deg
-        v_r_mm = right_speed * mm_per_deg
-
-        omega = (v_r_mm - v_l_mm) / self.axle_width
-
-        t = math.radians(angle) / abs(omega)
+        deg_l, speed_l, deg_r, speed_r = self._plan_steer(turn_rate, angle)
+        self._l_rot(deg_l, speed_l, 0)
+        self._r_rot(deg_r, speed_r, 0)
 
-        s_l_mm = v_l_mm * t
-        s_r_mm = v_r_mm * t
+        if wait_until_done:
+            timeout_ms = None if timeout is None else timeout * 1000
+            self._l_wait(timeout_ms)
+            self._r_wait(timeout_ms)
 
-        deg_l = self._mm_to_deg(s_l_mm)
-        deg_r = self._mm_to_deg(s_r_mm)
+    def execute_path(self, segments, wait_until_done: bool = True, timeout: float = None):
+        """
+        Projede trasu složenou z několika úseků za sebou.
 
-        self.left_motor.rotate_by_angle(round(deg_l), round(abs(left_speed)), 0)
-        self.right_motor.rotate_by_angle(round(deg_r), round(abs(right_speed)), 0)
+        Všechny úseky se nejdřív přepočítají na pohyby motorů a teprve potom
+        se postupně vykonají, takže neplatná trasa se odmítne dřív, než se
+        robot vůbec rozjede.
 
-        if wait_until_done:
-            if timeout is None:
-                self.left_motor.wait_for_movement()
-                self.right_motor.wait_for_movement()
+        Argumenty:
+            segments: Posloupnost trojic (druh, parametr1, parametr2):
+                - (PATH_TRAVEL, vzdálenost v mm, nepoužito)
+                - (PATH_ROTATE, úhel ve stupních, nepoužito)
+                - (PATH_STEER, turn_rate, úhel ve stupních)
+            wait_until_done (bool, volitelné): Pokud je True, počká i na dokončení posledního úseku.
+                Na dokončení předchozích úseků se čeká vždy. Výchozí hodnota je True.
+            timeout (float, volitelné): Maximální doba čekání na každý úsek v sekundách.
+        """
+        plans = []
+        for kind, param1, param2 in segments:
+            if kind == PATH_TRAVEL:
+                plans.append(self._plan_travel(param1))
+            elif kind == PATH_ROTATE:
+                plans.append(self._plan_rotate(param1))
+            elif kind == PATH_STEER:
+                if param2 is None:
+                    raise ValueError("Usek PATH_STEER musi mit zadany uhel")
+                plans.append(self._plan_steer(param1, param2))
             else:
-                self.left_motor.wait_for_movement(timeout*1000)
-                self.right_motor.wait_for_movement(timeout*1000)
+                raise ValueError("Neznamy druh useku trasy: {}".format(kind))
+
+        timeout_ms = None if timeout is None else timeout * 1000
+        last = len(plans) - 1
+        for i, (deg_l, speed_l, deg_r, speed_r) in enumerate(plans):
+            self._l_rot(deg_l, speed_l, 0)
+            self._r_rot(deg_r, speed_r, 0)
+            if wait_until_done or i < last:
+                self._l_wait(timeout_ms)
+                self._r_wait(timeout_ms)
 
     def stop(self):
         """
         Zastaví oba motory robota.
         """
-        self.left_motor.brake()
-        self.right_motor.brake()
+        self._l_brake()
+        self._r_brake()
 
     ######################
     ### INFO FUNCTIONS ###
@@ -222,29 +355,18 @@ class Pilot:
         Vrátí aktuální úhel natočení robota (stupně).
         Kladné hodnoty = zatočení doprava (po směru hodin).
         """
-        left_motor_rotation = self.left_motor.current_angle()
-        right_motor_rotation = self.right_motor.current_angle()
-
-        rotation_difference = (
-            left_motor_rotation - right_motor_rotation - self._angle_offset
-        )
-
-        return rotation_difference / (math.pi * self.axle_width * 4) * 360
+        rotation_difference = self._l_angle() - self._r_angle() - self._angle_offset
+        return rotation_difference * self._get_angle_scale
 
     def reset_angle(self):
         """
         Resetuje aktuální úhel natočení robota na 0 stupňů.
         """
-        self._angle_offset = (
-            self.left_motor.current_angle() - self.right_motor.current_angle()
-        )
+        self._angle_offset = self._l_angle() - self._r_angle()
 
     def is_moving(self) -> bool:
         """Vrátí True když se minimálně jeden motor točí."""
-        return (
-            abs(self.left_motor.current_speed()) > 0
-            or abs(self.right_motor.current_speed()) > 0
-        )
+        return self._l_speed() != 0 or self._r_speed() != 0
 
     def get_acceleration(self):
         """
@@ -273,74 +395,154 @@ class Pilot:
         """
         self.speed = speed
 
+######################
+### Frekvence tónů ###
+######################
+# Frekvence jsou dostupné přímo jako konstanty modulu
+# (`from robotabor import A4`), nebo přes jmenný prostor `Frequencies.A4`.
+C4 = 261
+Cs4 = 277
+D4 = 293
+Ds4 = 311
+E4 = 329
+F4 = 349
+Fs4 = 370
+G4 = 392
+Gs4 = 415
+A4 = 440
+As4 = 466
+B4 = 493
+
+C5 = 523
+Cs5 = 554
+D5 = 587
+Ds5 = 622
+E5 = 659
+F5 = 698
+Fs5 = 740
+G5 = 784
+Gs5 = 831
+A5 = 880
+As5 = 932
+B5 = 987
+
+C6 = 1046
+Cs6 = 1108
+D6 = 1174
+Ds6 = 1244
+E6 = 1318
+F6 = 1396
+Fs6 = 1480
+G6 = 1568
+Gs6 = 1661
+A6 = 1760
+As6 = 1864
+B6 = 1975
+
 class Frequencies:
-    C4 = 261
-    Cs4 = 277
-    D4 = 293
-    Ds4 = 311
-    E4 = 329
-    F4 = 349
-    Fs4 = 370
-    G4 = 392
-    Gs4 = 415
-    A4 = 440
-    As4 = 466
-    B4 = 493
-
-    C5 = 523
-    Cs5 = 554
-    D5 = 587
-    Ds5 = 622
-    E5 = 659
-    F5 = 698
-    Fs5 = 740
-    G5 = 784
-    Gs5 = 831
-    A5 = 880
-    As5 = 932
-    B5 = 987
-
-    C6 = 1046
-    Cs6 = 1108
-    D6 = 1174
-    Ds6 = 1244
-    E6 = 1318
-    F6 = 1396
-    Fs6 = 1480
-    G6 = 1568
-    Gs6 = 1661
-    A6 = 1760
-    As6 = 1864
-    B6 = 1975
+    # Zpětná kompatibilita pro `Frequencies.A4`
+    C4 = C4
+    Cs4 = Cs4
+    D4 = D4
+    Ds4 = Ds4
+    E4 = E4
+    F4 = F4
+    Fs4 = Fs4
+    G4 = G4
+    Gs4 = Gs4
+    A4 = A4
+    As4 = As4
+    B4 = B4
+
+    C5 = C5
+    Cs5 = Cs5
+    D5 = D5
+    Ds5 = Ds5
+    E5 = E5
+    F5 = F5
+    Fs5 = Fs5
+    G5 = G5
+    Gs5 = Gs5
+    A5 = A5
+    As5 = As5
+    B5 = B5
+
+    C6 = C6
+    Cs6 = Cs6
+    D6 = D6
+    Ds6 = Ds6
+    E6 = E6
+    F6 = F6
+    Fs6 = Fs6
+    G6 = G6
+    Gs6 = Gs6
+    A6 = A6
+    As6 = As6
+    B6 = B6
 
 class NotePlayer:
+    __slots__ = (
+        "repeat", "_freqs", "_durs_ms", "current_index", "is_playing",
+        "_next_deadline", "_play_tone",
+    )
+
     def __init__(self, repeat=True):
         self.repeat = repeat
-        self.queue = []
-        self.current_index = 0
+        # Fronta tónů jako dvě souběžná pole celých čísel (Hz, ms), viz `clear()`
+        self.clear()
         self.is_playing = False
-        self.note_start_time = 0
-        self.note_duration = 0
+        self._next_deadline = _ticks_ms()  # ms (ticks)
+        self._play_tone = None  # načte se až při prvním přehraném tónu
 
     def add_note(self, frequency, duration_ms=1000):
-        """Přidá tón (frekvenci a dobu trvání v ms) do fronty přehrávání."""
-        self.queue.append((frequency, duration_ms))
+        """
+        Přidá tón (frekvenci a dobu trvání v ms) do fronty přehrávání.
+
+        Obě hodnoty se zaokrouhlí na celá čísla. Frekvence musí být
+        v rozsahu 0 … 65535 Hz a doba trvání nesmí být záporná.
+        """
+        frequency = round(frequency)
+        duration_ms = round(duration_ms)
+        if not 0 <= frequency <= 65535:
+            raise ValueError("Frekvence musi byt v rozsahu 0 az 65535 Hz: {}".format(frequency))
+        if duration_ms < 0:
+            raise ValueError("Doba trvani tonu nesmi byt zaporna: {}".format(duration_ms))
+        self._freqs.append(frequency)
+        self._durs_ms.append(duration_ms)
+
+    def clear(self):
+        """Vyprázdní frontu tónů a vrátí pozici přehrávání na začátek."""
+        self._freqs = array.array("H")
+        self._durs_ms = array.array("I")
+        self.current_index = 0
+
+    @property
+    def queue(self):
+        """
+        Seznam tónů ve frontě jako dvojice (frekvence, doba trvání v ms).
+
+        Vrací kopii – frontu měňte přes `add_note()` a `clear()`,
+        nebo ji celou nahraďte přiřazením `player.queue = [...]`.
+        """
+        return list(zip(self._freqs, self._durs_ms))
+
+    @queue.setter
+    def queue(self, notes):
+        self.clear()
+        for frequency, duration_ms in notes:
+            self.add_note(frequency, duration_ms)
 
     def play(self):
         """Spustí přehrávání fronty tónů od začátku."""
         self.current_index = 0
         self.is_playing = True
-        self.note_start_time = 0
+        self._next_deadline = _ticks_ms()
 
     def stop(self):
         """Zastaví přehrávání tónů a resetuje pozici ve frontě."""
         self.is_playing = False
         self.current_index = 0
 
-    def _should_play_next_note(self):
-        """Vrací True, pokud od začátku poslední noty uplynula její doba trvání."""
-        return time.time() * 1000 - self.note_start_time >= self.note_duration
-
     def update(self):
         """
         Aktualizuje přehrávání – pokud je čas na další tón, přehraje jej.
@@ -349,19 +551,31 @@ class NotePlayer:
         (např. v hlavním cyklu robota), aby bylo možné přehrávat tóny na pozadí,
         aniž by došlo k blokování běhu programu.
         """
-        if not self.is_playing or not self.queue:
+        if not self.is_playing:
+            return
+
+        now = _ticks_ms()
+        if _ticks_diff(now, self._next_deadline) < 0:
             return
 
-        if self.note_start_time == 0 or self._should_play_next_note():
-            frequency, duration = self.queue[self.current_index]
-            play_tone(frequency, duration)
-            self.note_start_time = time.time() * 1000
-            self.note_duration = duration
+        freqs = self._freqs
+        if not freqs:
+            return
+
+        play_tone = self._play_tone
+        if play_tone is None:
+            from brian.audio import play_tone
+
+            self._play_tone = play_tone
 
-            self.current_index += 1
-            if self.current_index >= len(self.queue):
-                if self.repeat:
-                    self.current_index = 0
-                else:
-                    self.stop()
+        index = self.current_index
+        duration_ms = self._durs_ms[index]
+        play_tone(freqs[index], duration_ms)
+        self._next_deadline = _ticks_add(now, duration_ms)
 
+        index += 1
+        if index >= len(freqs):
+            index = 0
+            if not self.repeat:
+                self.is_playing = False
+        self.current_index = index
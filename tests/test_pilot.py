@@ -0,0 +1,191 @@
+"""
+Porovnání výpočtů `Pilot` s původními vzorci.
+
+Balíček `brian` v repozitáři obsahuje jen stuby firmwaru a v CPythonu ho
+nelze importovat, proto se `brian.motors` nahradí jednoduchým falešným
+motorem, který si zapisuje přijaté příkazy.
+
+Spuštění:  python -m unittest discover -s tests
+"""
+import math
+import os
+import sys
+import types
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeMotor:
+    def __init__(self):
+        self.commands = []
+        self.angle = 0
+        self.speed = 0
+
+    def wait_until_ready(self, timeout_ms=None):
+        return True
+
+    def current_angle(self):
+        return self.angle
+
+    def current_speed(self):
+        return self.speed
+
+    def run_at_speed(self, deg_per_sec):
+        self.commands.append(("run", deg_per_sec))
+
+    def rotate_by_angle(self, angle, speed, timeout=None):
+        self.commands.append(("rotate", angle, speed))
+
+    def wait_for_movement(self, timeout_ms=None):
+        pass
+
+    def brake(self):
+        pass
+
+
+_brian = types.ModuleType("brian")
+_motors = types.ModuleType("brian.motors")
+_motors.Motor = FakeMotor
+_brian.motors = _motors
+sys.modules.setdefault("brian", _brian)
+sys.modules.setdefault("brian.motors", _motors)
+
+import robotabor  # noqa: E402
+
+GEOMETRIES = [(56, 100), (43.2, 117), (81.6, 150)]
+SPEEDS = [400, 250, 137.5]
+
+
+def _mm_to_deg(mm, wheel_diameter):
+    return round(mm * 360 / (math.pi * wheel_diameter))
+
+
+def baseline_travel(distance, speed, wheel_diameter, reverse):
+    degrees = _mm_to_deg(distance, wheel_diameter)
+    if reverse:
+        degrees = -degrees
+    return [("rotate", round(degrees), round(speed))] * 2
+
+
+def baseline_rotate(angle, speed, wheel_diameter, axle_width, reverse):
+    arc_mm = (angle / 360) * math.pi * axle_width
+    degrees = _mm_to_deg(arc_mm, wheel_diameter)
+    left_speed = speed if not reverse else -speed
+    return [
+        ("rotate", round(degrees), round(left_speed)),
+        ("rotate", -round(degrees), round(-left_speed)),
+    ]
+
+
+def baseline_steer(turn_rate, angle, speed, wheel_diameter, axle_width, reverse):
+    turn_rate = max(-200, min(200, turn_rate))
+    abs_tr = abs(turn_rate)
+    if abs_tr <= 100:
+        ratio = 1 - abs_tr / 100
+    else:
+        ratio = -(abs_tr - 100) / 100
+    if turn_rate > 0:
+        left_speed, right_speed = speed * ratio, speed
+    else:
+        left_speed, right_speed = speed, speed * ratio
+    if reverse:
+        left_speed, right_speed = -left_speed, -right_speed
+
+    mm_per_deg = (math.pi * wheel_diameter) / 360
+    v_l_mm = left_speed * mm_per_deg
+    v_r_mm = right_speed * mm_per_deg
+    omega = (v_r_mm - v_l_mm) / axle_width
+    t = math.radians(angle) / abs(omega)
+    deg_l = _mm_to_deg(v_l_mm * t, wheel_diameter)
+    deg_r = _mm_to_deg(v_r_mm * t, wheel_diameter)
+    return [
+        ("rotate", round(deg_l), round(abs(left_speed))),
+        ("rotate", round(deg_r), round(abs(right_speed))),
+    ]
+
+
+class PilotFormulaTest(unittest.TestCase):
+    def make_pilot(self, wheel_diameter, axle_width, reverse, speed):
+        self.left, self.right = FakeMotor(), FakeMotor()
+        pilot = robotabor.Pilot(self.left, self.right, wheel_diameter, axle_width, reverse)
+        pilot.set_speed(speed)
+        return pilot
+
+    def commands(self):
+        commands = self.left.commands + self.right.commands
+        self.left.commands, self.right.commands = [], []
+        return commands
+
+    def assert_commands_close(self, actual, expected, tolerance):
+        self.assertEqual(len(actual), len(expected))
+        for got, want in zip(actual, expected):
+            self.assertEqual(got[0], want[0])
+            for got_value, want_value in zip(got[1:], want[1:]):
+                self.assertLessEqual(abs(got_value - want_value), tolerance, (got, want))
+
+    def for_each_setup(self):
+        for wheel_diameter, axle_width in GEOMETRIES:
+            for reverse in (False, True):
+                for speed in SPEEDS:
+                    with self.subTest(d=wheel_diameter, w=axle_width, reverse=reverse, speed=speed):
+                        yield self.make_pilot(wheel_diameter, axle_width, reverse, speed), (
+                            speed, wheel_diameter, axle_width, reverse
+                        )
+
+    def test_travel_matches_baseline(self):
+        for pilot, (speed, wheel_diameter, _, reverse) in self.for_each_setup():
+            for distance in (-1234.5, -1, 0, 1, 17.3, 500, 2000):
+                pilot.travel(distance, wait_until_done=False)
+                self.assert_commands_close(
+                    self.commands(), baseline_travel(distance, speed, wheel_diameter, reverse), 1
+                )
+
+    def test_rotate_matches_baseline(self):
+        for pilot, (speed, wheel_diameter, axle_width, reverse) in self.for_each_setup():
+            for angle in (-720, -90, -1, 0, 33.3, 90, 181):
+                pilot.rotate(angle, wait_until_done=False)
+                self.assert_commands_close(
+                    self.commands(),
+                    baseline_rotate(angle, speed, wheel_diameter, axle_width, reverse),
+                    1,
+                )
+
+    def test_steer_matches_baseline(self):
+        for pilot, setup in self.for_each_setup():
+            speed, wheel_diameter, axle_width, reverse = setup
+            for turn_rate in (-300, -200, -150, -100, -37, 12.5, 50, 100, 170, 200, 250):
+                for angle in (-90, 45, 360):
+                    pilot.steer(turn_rate, angle, wait_until_done=False)
+                    self.assert_commands_close(
+                        self.commands(),
+                        baseline_steer(turn_rate, angle, speed, wheel_diameter, axle_width, reverse),
+                        1,
+                    )
+
+    def test_execute_path_matches_single_moves(self):
+        pilot = self.make_pilot(56, 100, False, 400)
+        pilot.execute_path([
+            (robotabor.PATH_TRAVEL, 100, 0),
+            (robotabor.PATH_ROTATE, 90, 0),
+            (robotabor.PATH_STEER, 50, 90),
+        ])
+        planned = self.commands()
+        pilot.travel(100)
+        pilot.rotate(90)
+        pilot.steer(50, 90)
+        self.assertEqual(planned, self.commands())
+
+    def test_get_angle_reads_back_rotate(self):
+        for wheel_diameter, axle_width in GEOMETRIES:
+            with self.subTest(d=wheel_diameter, w=axle_width):
+                pilot = self.make_pilot(wheel_diameter, axle_width, False, 400)
+                pilot.rotate(90)
+                (_, left_deg, _), (_, right_deg, _) = self.commands()
+                self.left.angle, self.right.angle = left_deg, right_deg
+                # jeden stupeň kola odpovídá wheel_diameter / (2 * axle_width) stupně robota
+                self.assertAlmostEqual(pilot.get_angle(), 90, delta=wheel_diameter / axle_width)
+
+
+if __name__ == "__main__":
+    unittest.main()